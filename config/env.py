@@ -0,0 +1,69 @@
+"""
+Validated environment configuration for production settings.
+
+The environment is read and coerced exactly once at import, so
+misconfiguration (a non-numeric DB_PORT, an unset ALLOWED_HOSTS that
+would otherwise become [""]) fails at startup instead of at the first
+request.
+"""
+
+import os
+from dataclasses import dataclass
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    """
+    Frozen snapshot of production environment variables.
+
+    Attributes:
+        allowed_hosts: Hostnames parsed from ALLOWED_HOSTS (empty entries dropped)
+        db_name: PostgreSQL database name
+        db_user: PostgreSQL user
+        db_password: PostgreSQL password
+        db_host: PostgreSQL host
+        db_port: PostgreSQL port (validated integer)
+    """
+
+    allowed_hosts: tuple
+    db_name: str
+    db_user: str
+    db_password: str
+    db_host: str
+    db_port: int
+
+    @classmethod
+    def from_environ(cls):
+        """
+        Build an Env from os.environ with type coercion and validation.
+
+        Returns:
+            Env: Frozen, validated configuration
+
+        Raises:
+            ImproperlyConfigured: If DB_PORT is not an integer
+        """
+        allowed_hosts = tuple(
+            host.strip()
+            for host in os.getenv("ALLOWED_HOSTS", "").split(",")
+            if host.strip()
+        )
+
+        db_port = os.getenv("DB_PORT", "5432")
+        try:
+            db_port = int(db_port)
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"DB_PORT must be an integer, got {db_port!r}"
+            )
+
+        return cls(
+            allowed_hosts=allowed_hosts,
+            db_name=os.getenv("DB_NAME", "shortify_link"),
+            db_user=os.getenv("DB_USER", "postgres"),
+            db_password=os.getenv("DB_PASSWORD", ""),
+            db_host=os.getenv("DB_HOST", "localhost"),
+            db_port=db_port,
+        )
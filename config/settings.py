@@ -6,6 +6,7 @@ Base settings shared across all environments.
 
 from pathlib import Path
 import os
+import queue
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -82,15 +83,30 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 # Database
 # Use DATABASE_URL from Railway or fallback to SQLite
-import dj_database_url
-
-DATABASES = {
-    "default": dj_database_url.config(
-        default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
-        conn_max_age=600,
-        conn_health_checks=True,
-    )
-}
+
+
+def _build_default_db():
+    """
+    Build the default database config, parsing DATABASE_URL only when set.
+
+    dj_database_url is imported lazily so environments that override
+    DATABASES (dev/prod settings) or run without DATABASE_URL skip the
+    import cost on every manage.py invocation and worker boot.
+    """
+    if os.getenv("DATABASE_URL"):
+        import dj_database_url
+
+        return dj_database_url.config(
+            conn_max_age=600,
+            conn_health_checks=True,
+        )
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+    }
+
+
+DATABASES = {"default": _build_default_db()}
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -129,7 +145,24 @@ STORAGES = {
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Redirect 302 caching: when > 0, RedirectView emits
+# Cache-Control: public, max-age=<N> so CDNs/browsers can serve repeat
+# redirects without hitting Django - clicks served from those caches go
+# untracked for the TTL, so this stays off unless redirect throughput
+# matters more than exact counts
+REDIRECT_PUBLIC_MAX_AGE = 0
+
+# Click tracking write batching (drained by links.services._ClickWriter)
+CLICK_WRITER_MAX_QUEUE = 10000
+CLICK_WRITER_BATCH_SIZE = 500
+CLICK_WRITER_FLUSH_INTERVAL = 1.0  # seconds
+
 # Logging configuration
+# Request threads enqueue records via QueueHandler; a QueueListener
+# (started in LinksConfig.ready) does the blocking stream writes off
+# the request path
+LOGGING_QUEUE = queue.Queue(-1)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -144,19 +177,23 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": LOGGING_QUEUE,
+        },
     },
     "root": {
-        "handlers": ["console"],
+        "handlers": ["queue"],
         "level": "INFO",
     },
     "loggers": {
         "links": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": "DEBUG",
             "propagate": False,
         },
         "core": {
-            "handlers": ["console"],
+            "handlers": ["queue"],
             "level": "DEBUG",
             "propagate": False,
         },
@@ -5,21 +5,24 @@ Uses PostgreSQL database and DEBUG=False.
 """
 
 from .settings import *
-import os
+from .env import Env
+
+# Environment is read, coerced, and validated once at import
+env = Env.from_environ()
 
 DEBUG = False
 
-ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "").split(",")
+ALLOWED_HOSTS = list(env.allowed_hosts)
 
 # PostgreSQL database for production
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.getenv("DB_NAME", "shortify_link"),
-        "USER": os.getenv("DB_USER", "postgres"),
-        "PASSWORD": os.getenv("DB_PASSWORD", ""),
-        "HOST": os.getenv("DB_HOST", "localhost"),
-        "PORT": os.getenv("DB_PORT", "5432"),
+        "NAME": env.db_name,
+        "USER": env.db_user,
+        "PASSWORD": env.db_password,
+        "HOST": env.db_host,
+        "PORT": str(env.db_port),
     }
 }
 
@@ -15,26 +15,12 @@ class ShortLinkAdmin(ModelAdmin):
     Admin interface for ShortLink model with Unfold styling.
     """
 
-    list_display = ["short_code", "original_url_truncated", "clicks_count", "created_at"]
+    list_display = ["short_code", "original_url_display", "clicks_count", "created_at"]
     list_filter = ["created_at"]
     search_fields = ["short_code", "original_url"]
     readonly_fields = ["short_code", "created_at", "clicks_count"]
     ordering = ["-created_at"]
 
-    def original_url_truncated(self, obj):
-        """
-        Display truncated original URL in list view.
-
-        Args:
-            obj: ShortLink instance
-
-        Returns:
-            str: Truncated URL (max 60 chars)
-        """
-        return obj.original_url[:60] + "..." if len(obj.original_url) > 60 else obj.original_url
-
-    original_url_truncated.short_description = "Original URL"
-
 
 @admin.register(Click)
 class ClickAdmin(ModelAdmin):
@@ -44,10 +30,26 @@ class ClickAdmin(ModelAdmin):
 
     list_display = ["short_code_display", "clicked_at", "ip_address", "referrer_truncated"]
     list_filter = ["clicked_at", "short_link"]
-    search_fields = ["short_link__short_code", "ip_address", "user_agent"]
+    list_select_related = ["short_link"]
+    search_fields = ["short_code_snapshot", "ip_address", "user_agent"]
     readonly_fields = ["short_link", "clicked_at", "query_params", "user_agent", "referrer", "ip_address"]
     ordering = ["-clicked_at"]
 
+    def get_queryset(self, request):
+        """
+        Get changelist queryset with the short_link FK pre-joined.
+
+        short_code_display crosses the FK for every row, so without the
+        join each rendered row would issue its own SELECT.
+
+        Args:
+            request: Django HttpRequest object
+
+        Returns:
+            QuerySet: Click queryset with select_related("short_link")
+        """
+        return super().get_queryset(request).select_related("short_link")
+
     def short_code_display(self, obj):
         """
         Display short code in list view.
@@ -72,8 +74,10 @@ class ClickAdmin(ModelAdmin):
         Returns:
             str: Truncated referrer (max 50 chars) or empty string
         """
-        if obj.referrer:
-            return obj.referrer[:50] + "..." if len(obj.referrer) > 50 else obj.referrer
+        referrer = obj.referrer
+        if referrer:
+            # O(1) slice sentinel instead of a full len() comparison
+            return f"{referrer[:50]}..." if referrer[50:51] else referrer
         return ""
 
     referrer_truncated.short_description = "Referrer"
@@ -1,6 +1,44 @@
+import atexit
+import logging
+from logging.handlers import QueueListener
+
 from django.apps import AppConfig
 
+_log_listener = None
+
 
 class LinksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "links"
+
+    def ready(self):
+        """Start the background log listener for the queue handler."""
+        self._start_log_listener()
+
+    @staticmethod
+    def _start_log_listener():
+        """
+        Drain LOGGING_QUEUE to the console on a background thread.
+
+        Request threads only enqueue records (via the "queue" handler in
+        settings.LOGGING); the listener performs the blocking writes.
+        """
+        global _log_listener
+        if _log_listener is not None:
+            return
+
+        from django.conf import settings
+
+        log_queue = getattr(settings, "LOGGING_QUEUE", None)
+        if log_queue is None:
+            return
+
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("{levelname} {asctime} {module} {message}", style="{")
+        )
+        _log_listener = QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
@@ -0,0 +1,88 @@
+"""
+Caching for the redirect hot path and dashboard stats.
+
+The short_code -> (pk, original_url) mapping is effectively immutable
+once a link is created, and redirect traffic is heavily skewed toward a
+few hot codes, so repeat redirects are served from the configured cache
+backend with no DB round-trip. Entries expire after an hour and are
+invalidated early by ShortLink save/delete signals. With the default
+LocMemCache each worker warms independently; pointing CACHES at a
+shared backend (e.g. Redis) makes the warm set process-wide.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import ShortLink
+
+REDIRECT_CACHE_TTL = 3600
+
+
+def _redirect_key(short_code):
+    """Cache key for a short code's redirect target."""
+    return f"sl:{short_code}"
+
+
+def get_redirect(short_code):
+    """
+    Look up a cached redirect target.
+
+    Args:
+        short_code: The short code being redirected
+
+    Returns:
+        tuple: (pk, original_url) if cached, else None
+    """
+    return cache.get(_redirect_key(short_code))
+
+
+def set_redirect(short_code, pk, original_url):
+    """
+    Cache a redirect target for REDIRECT_CACHE_TTL seconds.
+
+    Uses add() rather than set() as a stampede guard: when many misses
+    race on the same code, the first writer wins and the rest are no-ops.
+
+    Args:
+        short_code: The short code being redirected
+        pk: Primary key of the ShortLink
+        original_url: Redirect target URL
+    """
+    cache.add(_redirect_key(short_code), (pk, original_url), REDIRECT_CACHE_TTL)
+
+
+def invalidate_redirect(short_code):
+    """
+    Remove a short code from the cache (no-op if absent).
+
+    Args:
+        short_code: The short code to invalidate
+    """
+    cache.delete(_redirect_key(short_code))
+
+
+def dashboard_version():
+    """
+    Current dashboard cache version, embedded in dashboard cache keys.
+
+    Returns:
+        int: Monotonically increasing version number
+    """
+    return cache.get_or_set("dash:ver", 1, None)
+
+
+def bump_dashboard_version():
+    """Invalidate cached dashboard stats by bumping the version key."""
+    try:
+        cache.incr("dash:ver")
+    except ValueError:
+        cache.set("dash:ver", 1, None)
+
+
+@receiver(post_save, sender=ShortLink)
+@receiver(post_delete, sender=ShortLink)
+def _invalidate_on_change(sender, instance, **kwargs):
+    """Drop cached entries when a link is saved or deleted."""
+    invalidate_redirect(instance.short_code)
+    bump_dashboard_version()
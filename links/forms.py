@@ -6,9 +6,39 @@ Forms:
     LinkFilterForm: Form for filtering links list
 """
 
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from django import forms
 from django.core.exceptions import ValidationError
-from .utils import validate_url
+from .utils import validate_url_constraints
+
+
+def _canonicalize_url(url):
+    """
+    Normalize a URL into its canonical form for dedup hashing.
+
+    Lowercases the scheme and host and drops utm_* tracking params, so
+    casing and tracking-tag variants of the same destination hash to
+    the same url_sha256 and reuse one short link instead of inserting
+    near-duplicates.
+
+    Args:
+        url: Validated URL string
+
+    Returns:
+        str: Canonicalized URL
+    """
+    parts = urlsplit(url)
+    query = urlencode(
+        [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+        ]
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, parts.fragment)
+    )
 
 
 class CreateShortLinkForm(forms.Form):
@@ -31,10 +61,14 @@ class CreateShortLinkForm(forms.Form):
 
     def clean_original_url(self):
         """
-        Validate the original URL.
+        Validate and canonicalize the original URL.
+
+        URLField has already run the full URLValidator at this point, so
+        only the project-specific constraints are checked here, then the
+        URL is canonicalized so dedup sees one form per destination.
 
         Returns:
-            str: The validated URL
+            str: The validated, canonicalized URL
 
         Raises:
             ValidationError: If URL validation fails
@@ -42,9 +76,10 @@ class CreateShortLinkForm(forms.Form):
         url = self.cleaned_data.get('original_url')
         if url:
             try:
-                validate_url(url)
+                validate_url_constraints(url)
             except ValidationError as e:
                 raise ValidationError(str(e))
+            url = _canonicalize_url(url)
         return url
 
 
@@ -0,0 +1,18 @@
+"""
+Management command to flush buffered click events to the database.
+
+Useful before planned shutdowns or in tests, when waiting for the click
+writer's flush interval is not an option.
+"""
+
+from django.core.management.base import BaseCommand
+
+from links.services import _writer
+
+
+class Command(BaseCommand):
+    help = "Write any click events still buffered in the background writer"
+
+    def handle(self, *args, **options):
+        _writer.flush()
+        self.stdout.write(self.style.SUCCESS("Flushed pending click events"))
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='click',
+            name='clicked_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,46 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_url_sha256(apps, schema_editor):
+    """Populate url_sha256 for existing links in chunks of 10k."""
+    ShortLink = apps.get_model("links", "ShortLink")
+    batch = []
+    queryset = ShortLink.objects.filter(url_sha256__isnull=True).only(
+        "id", "original_url"
+    )
+    for link in queryset.iterator(chunk_size=10000):
+        link.url_sha256 = hashlib.sha256(link.original_url.encode()).digest()
+        batch.append(link)
+        if len(batch) >= 10000:
+            ShortLink.objects.bulk_update(batch, ["url_sha256"])
+            batch = []
+    if batch:
+        ShortLink.objects.bulk_update(batch, ["url_sha256"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("links", "0002_alter_click_clicked_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shortlink",
+            name="url_sha256",
+            field=models.BinaryField(editable=False, max_length=32, null=True),
+        ),
+        migrations.RunPython(backfill_url_sha256, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="shortlink",
+            name="url_sha256",
+            field=models.BinaryField(editable=False, max_length=32, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="shortlink",
+            name="original_url",
+            field=models.URLField(max_length=2048),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:47
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0003_shortlink_url_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shortlink',
+            name='original_url_display',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(original_url__length__gt=60, then=django.db.models.functions.text.Concat(django.db.models.functions.text.Left('original_url', 60), models.Value('...'))), default=models.F('original_url'), output_field=models.CharField(max_length=63)), output_field=models.CharField(max_length=63), verbose_name='Original URL'),
+        ),
+    ]
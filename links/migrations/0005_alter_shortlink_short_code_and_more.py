@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0004_shortlink_original_url_display'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='shortlink',
+            name='short_code',
+            field=models.CharField(max_length=10, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='shortlink',
+            index=models.Index(fields=['short_code'], include=('original_url', 'id'), name='links_sl_code_covering'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:50
+
+import links.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0005_alter_shortlink_short_code_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='click',
+            name='query_params',
+            field=models.JSONField(blank=True, encoder=links.models.CompactJSONEncoder, null=True),
+        ),
+    ]
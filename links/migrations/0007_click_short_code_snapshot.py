@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0006_alter_click_query_params'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='click',
+            name='short_code_snapshot',
+            field=models.CharField(default='', editable=False, max_length=10),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:52
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0007_click_short_code_snapshot'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='click',
+            name='links_click_clicked_dd3348_idx',
+        ),
+    ]
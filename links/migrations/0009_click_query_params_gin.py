@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    """Create a GIN index over query_params (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS links_click_query_params_gin "
+        "ON links_click USING gin (query_params);"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    """Drop the query_params GIN index (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "DROP INDEX IF EXISTS links_click_query_params_gin;"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("links", "0008_remove_click_links_click_clicked_dd3348_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:55
+
+from django.db import migrations, models
+
+
+def create_trgm_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes so icontains search is sargable (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS links_sl_url_trgm "
+        "ON links_shortlink USING gin (original_url gin_trgm_ops);"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS links_sl_code_trgm "
+        "ON links_shortlink USING gin (short_code gin_trgm_ops);"
+    )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    """Drop the trigram indexes (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS links_sl_url_trgm;")
+    schema_editor.execute("DROP INDEX IF EXISTS links_sl_code_trgm;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0009_click_query_params_gin'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='shortlink',
+            index=models.Index(fields=['-created_at'], name='links_sl_created_desc'),
+        ),
+        migrations.AddIndex(
+            model_name='shortlink',
+            index=models.Index(fields=['-clicks_count'], name='links_sl_clicks_desc'),
+        ),
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.15 on 2026-09-01 03:58
+
+from django.db import migrations, models
+
+
+def create_top10_view(apps, schema_editor):
+    """Create the links_top10 materialized view (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS links_top10 AS "
+        "SELECT id, original_url, short_code, created_at, clicks_count "
+        "FROM links_shortlink ORDER BY clicks_count DESC LIMIT 100;"
+    )
+    # REFRESH CONCURRENTLY requires a unique index on the view
+    schema_editor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS links_top10_id_uniq "
+        "ON links_top10 (id);"
+    )
+
+
+def drop_top10_view(apps, schema_editor):
+    """Drop the links_top10 materialized view (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP MATERIALIZED VIEW IF EXISTS links_top10;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0010_shortlink_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TopLink',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('original_url', models.URLField(max_length=2048)),
+                ('short_code', models.CharField(max_length=10)),
+                ('created_at', models.DateTimeField()),
+                ('clicks_count', models.PositiveIntegerField()),
+            ],
+            options={
+                'verbose_name': 'Top Link',
+                'verbose_name_plural': 'Top Links',
+                'db_table': 'links_top10',
+                'ordering': ['-clicks_count'],
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_top10_view, drop_top10_view),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_short_code_snapshot(apps, schema_editor):
+    """Copy short_code onto pre-snapshot clicks in chunks of 10k."""
+    Click = apps.get_model("links", "Click")
+    ShortLink = apps.get_model("links", "ShortLink")
+    code_subquery = Subquery(
+        ShortLink.objects.filter(pk=OuterRef("short_link_id")).values(
+            "short_code"
+        )[:1]
+    )
+    while True:
+        ids = list(
+            Click.objects.filter(short_code_snapshot="").values_list(
+                "id", flat=True
+            )[:10000]
+        )
+        if not ids:
+            break
+        Click.objects.filter(id__in=ids).update(
+            short_code_snapshot=code_subquery
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("links", "0011_toplink"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_short_code_snapshot, migrations.RunPython.noop
+        ),
+    ]
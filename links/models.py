@@ -6,9 +6,31 @@ Models:
     Click: Represents a click/visit event on a short link
 """
 
+import hashlib
+import json
+
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Concat, Left, Length
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+models.CharField.register_lookup(Length)
+
+
+class CompactJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder without separator whitespace or ASCII escaping.
+
+    Shrinks the serialized query_params payload written on every click
+    while keeping the column a queryable JSONField.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["separators"] = (",", ":")
+        kwargs["ensure_ascii"] = False
+        super().__init__(*args, **kwargs)
 
 
 class ShortLink(models.Model):
@@ -17,14 +39,32 @@ class ShortLink(models.Model):
 
     Attributes:
         original_url: The long URL to redirect to
+        original_url_display: Truncated URL computed by the database (admin lists)
+        url_sha256: SHA-256 digest of original_url (unique, used for dedup lookups)
         short_code: The generated short identifier (6-10 chars)
         created_at: Timestamp of link creation
         clicks_count: Denormalized count of clicks (updated by service)
     """
 
     id = models.BigAutoField(primary_key=True)
-    original_url = models.URLField(max_length=2048, unique=True, db_index=True)
-    short_code = models.CharField(max_length=10, unique=True, db_index=True)
+    original_url = models.URLField(max_length=2048)
+    original_url_display = models.GeneratedField(
+        expression=Case(
+            When(
+                original_url__length__gt=60,
+                then=Concat(Left("original_url", 60), Value("...")),
+            ),
+            default=F("original_url"),
+            output_field=models.CharField(max_length=63),
+        ),
+        output_field=models.CharField(max_length=63),
+        db_persist=True,
+        verbose_name="Original URL",
+    )
+    # Uniqueness and dedup lookups go through the 32-byte hash instead of
+    # a btree over the full 2KB URL, keeping the index cache-friendly
+    url_sha256 = models.BinaryField(max_length=32, unique=True, editable=False)
+    short_code = models.CharField(max_length=10, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     clicks_count = models.PositiveIntegerField(default=0)
 
@@ -33,11 +73,44 @@ class ShortLink(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Short Link"
         verbose_name_plural = "Short Links"
+        indexes = [
+            # Covers the redirect lookup: on PostgreSQL the INCLUDEd
+            # columns make SELECT id, original_url BY short_code an
+            # index-only scan with no heap fetch
+            models.Index(
+                fields=["short_code"],
+                include=["original_url", "id"],
+                name="links_sl_code_covering",
+            ),
+            # Back the list view's ORDER BY paths so sorted pages are an
+            # index walk instead of a filesort
+            models.Index(fields=["-created_at"], name="links_sl_created_desc"),
+            models.Index(fields=["-clicks_count"], name="links_sl_clicks_desc"),
+        ]
 
     def __str__(self):
         """String representation showing short_code and truncated URL."""
         return f"{self.short_code} → {self.original_url[:50]}"
 
+    @staticmethod
+    def hash_url(url):
+        """
+        Compute the SHA-256 digest used for URL dedup lookups.
+
+        Args:
+            url: URL string to hash
+
+        Returns:
+            bytes: 32-byte SHA-256 digest
+        """
+        return hashlib.sha256(url.encode()).digest()
+
+    def save(self, *args, **kwargs):
+        """Populate url_sha256 from original_url before saving."""
+        if self.original_url:
+            self.url_sha256 = self.hash_url(self.original_url)
+        super().save(*args, **kwargs)
+
     def clean(self):
         """
         Validate URL has required protocol and is not localhost.
@@ -52,12 +125,42 @@ class ShortLink(models.Model):
                 raise ValidationError("Localhost URLs are not allowed")
 
 
+class TopLink(models.Model):
+    """
+    Read-only mapping over the links_top10 materialized view.
+
+    The view holds the 100 most-clicked links presorted by the database
+    (PostgreSQL only; created by a vendor-gated migration and refreshed
+    by the refresh_top_links command). Serving the dashboard's top-links
+    panel from it replaces a full-table ORDER BY with a handful-of-rows
+    SELECT. Slightly stale by design - as fresh as the last refresh.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    original_url = models.URLField(max_length=2048)
+    short_code = models.CharField(max_length=10)
+    created_at = models.DateTimeField()
+    clicks_count = models.PositiveIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = "links_top10"
+        ordering = ["-clicks_count"]
+        verbose_name = "Top Link"
+        verbose_name_plural = "Top Links"
+
+    def __str__(self):
+        """String representation showing short_code and click count."""
+        return f"{self.short_code} ({self.clicks_count} clicks)"
+
+
 class Click(models.Model):
     """
     Represents a single click/visit event on a short link.
 
     Attributes:
         short_link: Reference to the shortened link that was clicked
+        short_code_snapshot: Denormalized short code captured at click time
         clicked_at: Timestamp of the click event
         query_params: JSON object containing UTM and other URL parameters
         user_agent: Browser/device user agent string
@@ -69,8 +172,13 @@ class Click(models.Model):
     short_link = models.ForeignKey(
         ShortLink, on_delete=models.CASCADE, related_name="clicks"
     )
-    clicked_at = models.DateTimeField(auto_now_add=True, db_index=True)
-    query_params = models.JSONField(null=True, blank=True)
+    # Captured at click time so __str__ and admin search never have to
+    # follow the FK with an extra SELECT
+    short_code_snapshot = models.CharField(max_length=10, default="", editable=False)
+    # default (not auto_now_add) so the batched click writer can preserve
+    # the enqueue-time timestamp rather than the flush time
+    clicked_at = models.DateTimeField(default=timezone.now, db_index=True, editable=False)
+    query_params = models.JSONField(null=True, blank=True, encoder=CompactJSONEncoder)
     user_agent = models.TextField(null=True, blank=True)
     referrer = models.URLField(max_length=2048, null=True, blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
@@ -80,10 +188,7 @@ class Click(models.Model):
         ordering = ["-clicked_at"]
         verbose_name = "Click"
         verbose_name_plural = "Clicks"
-        indexes = [
-            models.Index(fields=["clicked_at"]),
-        ]
 
     def __str__(self):
         """String representation showing short_code and timestamp."""
-        return f"Click on {self.short_link.short_code} at {self.clicked_at}"
+        return f"Click on {self.short_code_snapshot} at {self.clicked_at}"
@@ -6,11 +6,20 @@ Services:
     ClickTrackerService: Handles click tracking and analytics
 """
 
+import atexit
 import logging
-from django.db import IntegrityError, transaction
+import queue
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
 from django.db.models import F
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
+from .cache import bump_dashboard_version
 from .models import ShortLink, Click
 from .utils import generate_short_code, validate_url
 
@@ -25,12 +34,14 @@ class LinkShortenerService:
     """
 
     @staticmethod
-    def create_link(original_url):
+    def create_link(original_url, skip_validation=False):
         """
         Create a shortened link with deduplication and collision retry.
 
         Args:
             original_url: The long URL to shorten
+            skip_validation: Skip URL validation when the caller (e.g. a
+                form with a URLField) has already validated the URL
 
         Returns:
             ShortLink: The created or existing ShortLink instance
@@ -41,52 +52,84 @@ class LinkShortenerService:
         """
         try:
             # Validate URL format and constraints
-            validate_url(original_url)
-
-            # Check for existing link (deduplication - FR-002a)
-            existing_link = ShortLink.objects.filter(
-                original_url=original_url
-            ).first()
-
-            if existing_link:
-                logger.info(
-                    f"Returning existing short link: {existing_link.short_code} "
-                    f"for URL: {original_url[:50]}"
+            if not skip_validation:
+                validate_url(original_url)
+
+            url_sha256 = ShortLink.hash_url(original_url)
+
+            # Dedup and create in one round-trip (deduplication - FR-002a):
+            # get_or_create pushes the duplicate-URL race onto the unique
+            # constraint instead of a separate SELECT-then-INSERT pair.
+            # Lookup goes through the narrow url_sha256 index, not the
+            # wide original_url column
+            try:
+                link, created = ShortLink.objects.get_or_create(
+                    url_sha256=url_sha256,
+                    defaults={
+                        "original_url": original_url,
+                        "short_code": generate_short_code(length=6),
+                    },
+                )
+                if created:
+                    logger.info(
+                        f"Created new short link: {link.short_code} "
+                        f"for URL: {original_url[:50]}"
+                    )
+                else:
+                    logger.info(
+                        f"Returning existing short link: {link.short_code} "
+                        f"for URL: {original_url[:50]}"
+                    )
+                return link
+
+            except IntegrityError as e:
+                # Short code collision on insert - fall back to the batched
+                # candidate probe below; anything else is a real error
+                if "short_code" not in str(e):
+                    raise
+                logger.warning(
+                    f"Short code collision on get_or_create for URL: "
+                    f"{original_url[:50]}"
                 )
-                return existing_link
-
-            # Generate unique short code with collision retry
-            max_retries = 10
-            for attempt in range(max_retries):
-                short_code = generate_short_code(length=6)
 
-                try:
-                    with transaction.atomic():
-                        link = ShortLink.objects.create(
+            # Insert a batch of candidate rows with ON CONFLICT DO NOTHING:
+            # the first candidate whose code is free lands (the rest then
+            # conflict on url_sha256 and are dropped), and a readback by
+            # hash returns the winner - whether it was ours or a
+            # concurrent request's. Two statements per round regardless
+            # of how many candidates collided. bulk_create bypasses
+            # save(), so url_sha256 is set explicitly.
+            max_rounds = 2
+            for attempt in range(max_rounds):
+                ShortLink.objects.bulk_create(
+                    [
+                        ShortLink(
                             original_url=original_url,
-                            short_code=short_code,
+                            url_sha256=url_sha256,
+                            short_code=generate_short_code(length=6),
                         )
-                        logger.info(
-                            f"Created new short link: {short_code} "
-                            f"for URL: {original_url[:50]}"
-                        )
-                        return link
-
-                except IntegrityError as e:
-                    # Short code collision - retry with new code
-                    if "short_code" in str(e):
-                        logger.warning(
-                            f"Short code collision on attempt {attempt + 1}: "
-                            f"{short_code}"
-                        )
-                        continue
-                    else:
-                        # Other integrity error (e.g., duplicate URL race condition)
-                        raise
+                        for _ in range(3)
+                    ],
+                    ignore_conflicts=True,
+                )
+
+                link = ShortLink.objects.filter(url_sha256=url_sha256).first()
+                if link is not None:
+                    logger.info(
+                        f"Created new short link: {link.short_code} "
+                        f"for URL: {original_url[:50]}"
+                    )
+                    return link
+
+                # All candidate codes collided - regenerate the batch
+                logger.warning(
+                    f"All candidate short codes collided on attempt "
+                    f"{attempt + 1} for URL: {original_url[:50]}"
+                )
 
             # Max retries exhausted
             raise RuntimeError(
-                f"Failed to generate unique short code after {max_retries} attempts"
+                f"Failed to generate unique short code after {max_rounds} attempts"
             )
 
         except ValidationError as e:
@@ -97,24 +140,226 @@ class LinkShortenerService:
             raise
 
 
+class _FlushRequest:
+    """
+    Marker enqueued by _ClickWriter.flush().
+
+    When the drain thread pulls one, it writes its in-flight batch and
+    sets `done`, so the flushing caller knows everything enqueued ahead
+    of the marker has hit the database.
+    """
+
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _ClickWriter:
+    """
+    Background writer that batches click inserts off the redirect path.
+
+    Redirect requests only enqueue (short_link_id, metadata, timestamp)
+    tuples; a daemon thread drains the queue and flushes batches with a
+    single bulk_create plus one grouped counter UPDATE per short link.
+    Queue overflow drops the event rather than blocking the redirect.
+    """
+
+    # Seconds between queue-full log lines; drops in between are counted
+    drop_log_interval = 10.0
+
+    def __init__(self, max_queue_size=10000, batch_size=500, flush_interval=1.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._drop_lock = threading.Lock()
+        self._dropped = 0
+        self._last_drop_log = 0.0
+
+    def enqueue(self, short_link_id, short_code, metadata, clicked_at):
+        """
+        Enqueue a click event for background insertion.
+
+        Args:
+            short_link_id: Primary key of the clicked ShortLink
+            short_code: Short code of the clicked link (denormalized snapshot)
+            metadata: Metadata dict from _extract_metadata
+            clicked_at: Timestamp of the click event
+
+        Returns:
+            bool: True if enqueued, False if dropped (queue full)
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((short_link_id, short_code, metadata, clicked_at))
+            return True
+        except queue.Full:
+            # A full queue means a click storm is already underway; a
+            # warning per dropped event would flood the log with exactly
+            # that traffic, so drops are counted and reported at most
+            # once per drop_log_interval
+            with self._drop_lock:
+                self._dropped += 1
+                now = time.monotonic()
+                if now - self._last_drop_log >= self.drop_log_interval:
+                    logger.warning(
+                        f"Click queue full: dropped {self._dropped} clicks "
+                        f"since last report"
+                    )
+                    self._dropped = 0
+                    self._last_drop_log = now
+            return False
+
+    def flush(self, timeout=5.0):
+        """
+        Write every buffered click event (used at shutdown and in tests).
+
+        Draining the queue alone is not enough: events the drain thread
+        has already pulled into its local batch are invisible here. With
+        a live drain thread, a flush marker is enqueued instead and the
+        call waits for the thread to write its in-flight batch plus
+        everything queued ahead of the marker. Without one (never
+        started, or a dying worker), the queue is drained synchronously.
+
+        Args:
+            timeout: Seconds to wait for the drain thread's acknowledgment
+        """
+        if self._thread is not None and self._thread.is_alive():
+            marker = _FlushRequest()
+            self._queue.put(marker)
+            marker.done.wait(timeout)
+            return
+
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+                continue
+            batch.append(item)
+        self._write_batch(batch)
+
+    def _ensure_started(self):
+        """Start the drain thread lazily so forked workers get their own."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._drain, name="click-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _drain(self):
+        """Accumulate events until batch_size or flush_interval, then write."""
+        batch = []
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if batch:
+                    self._write_batch(batch)
+                    batch = []
+                continue
+
+            if isinstance(item, _FlushRequest):
+                self._write_batch(batch)
+                batch = []
+                item.done.set()
+                continue
+
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch)
+                batch = []
+
+    def _write_batch(self, batch):
+        """
+        Write a batch of click events.
+
+        Issues one bulk_create for all Click rows, then one counter UPDATE
+        per distinct short link (grouped via Counter). Counter updates run
+        outside the insert transaction in sorted-pk order, so each hot
+        ShortLink row lock is held only for its own single-statement
+        UPDATE and concurrent writers take locks in a consistent order.
+        """
+        if not batch:
+            return
+
+        try:
+            close_old_connections()
+
+            clicks = [
+                Click(
+                    short_link_id=short_link_id,
+                    short_code_snapshot=short_code,
+                    clicked_at=clicked_at,
+                    query_params=metadata.get("query_params"),
+                    user_agent=metadata.get("user_agent"),
+                    referrer=metadata.get("referrer"),
+                    ip_address=metadata.get("ip_address"),
+                )
+                for short_link_id, short_code, metadata, clicked_at in batch
+            ]
+            counts = Counter(short_link_id for short_link_id, _, _, _ in batch)
+
+            with transaction.atomic():
+                Click.objects.bulk_create(clicks, batch_size=self.batch_size)
+
+            for short_link_id in sorted(counts):
+                ShortLink.objects.filter(pk=short_link_id).update(
+                    clicks_count=F("clicks_count") + counts[short_link_id]
+                )
+
+            # bulk_create and queryset update fire no signals, so cached
+            # dashboard stats are invalidated here
+            bump_dashboard_version()
+
+            logger.debug(
+                f"Flushed {len(batch)} clicks across {len(counts)} short links"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to flush click batch: {e}", exc_info=True)
+
+
+_writer = _ClickWriter(
+    max_queue_size=getattr(settings, "CLICK_WRITER_MAX_QUEUE", 10000),
+    batch_size=getattr(settings, "CLICK_WRITER_BATCH_SIZE", 500),
+    flush_interval=getattr(settings, "CLICK_WRITER_FLUSH_INTERVAL", 1.0),
+)
+atexit.register(_writer.flush)
+
+
 class ClickTrackerService:
     """
     Service for tracking clicks and updating analytics.
 
-    Handles metadata extraction and atomic counter updates.
+    Handles metadata extraction and batched background counter updates.
     """
 
     @staticmethod
-    def record_click(short_link, request):
+    def record_click(short_link_id, short_code, request):
         """
         Record a click event with metadata and update click counter.
 
+        The event is enqueued to a background writer that batches inserts
+        and counter updates, so no DB call happens on the redirect path.
+        Takes primitive identifiers rather than a model instance so
+        cache-served redirects never have to load the ShortLink.
+
         Args:
-            short_link: ShortLink instance that was clicked
+            short_link_id: Primary key of the clicked ShortLink
+            short_code: Short code of the clicked link (for logging)
             request: Django HttpRequest object with click metadata
 
         Returns:
-            Click: The created Click instance
+            None: Writes happen asynchronously in the background
 
         Raises:
             Exception: If click recording fails (logged but not raised)
@@ -123,30 +368,17 @@ class ClickTrackerService:
             # Extract metadata from request
             metadata = ClickTrackerService._extract_metadata(request)
 
-            with transaction.atomic():
-                # Create click record
-                click = Click.objects.create(
-                    short_link=short_link,
-                    query_params=metadata.get("query_params"),
-                    user_agent=metadata.get("user_agent"),
-                    referrer=metadata.get("referrer"),
-                    ip_address=metadata.get("ip_address"),
-                )
-
-                # Atomically increment clicks_count using F() expression
-                ShortLink.objects.filter(pk=short_link.pk).update(
-                    clicks_count=F("clicks_count") + 1
-                )
+            _writer.enqueue(short_link_id, short_code, metadata, timezone.now())
 
-                logger.info(
-                    f"Recorded click for {short_link.short_code} from "
-                    f"IP {metadata.get('ip_address', 'unknown')}"
-                )
-                return click
+            logger.info(
+                f"Recorded click for {short_code} from "
+                f"IP {metadata.get('ip_address', 'unknown')}"
+            )
+            return None
 
         except Exception as e:
             logger.error(
-                f"Failed to record click for {short_link.short_code}: {e}",
+                f"Failed to record click for {short_code}: {e}",
                 exc_info=True,
             )
             # Don't raise - click tracking shouldn't break redirects
@@ -165,9 +397,11 @@ class ClickTrackerService:
         """
         metadata = {}
 
-        # Extract query parameters (UTM params, etc.)
-        if request.GET:
-            metadata["query_params"] = dict(request.GET.items())
+        # Extract query parameters (UTM params, etc.) - QueryDict.dict()
+        # converts natively without the intermediate items() tuples, and
+        # the key is omitted entirely when there are no params
+        if len(request.GET):
+            metadata["query_params"] = request.GET.dict()
 
         # Extract user agent
         metadata["user_agent"] = request.META.get("HTTP_USER_AGENT")
@@ -4,26 +4,45 @@ Utility functions for Shortify Link.
 Functions:
     generate_short_code: Generate a random URL-safe short code
     validate_url: Validate URL format and constraints
+    validate_url_constraints: Validate only protocol/localhost constraints
 """
 
+import re
 import secrets
 import string
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 
+_ALPHABET = string.ascii_letters + string.digits  # a-zA-Z0-9
+_ALPHABET_LEN = len(_ALPHABET)
+
+# Protocol check and localhost rejection fused into one anchored pass;
+# re.IGNORECASE replaces the per-call .lower() copy of the full URL
+_URL_RE = re.compile(
+    r"^https?://(?!(?:localhost|127\.0\.0\.1)(?:[:/]|$))",
+    re.IGNORECASE,
+)
+
+# URLValidator compiles its regexes on instantiation - build it once
+_URL_VALIDATOR = URLValidator()
+
 
 def generate_short_code(length=6):
     """
     Generate a random URL-safe short code.
 
+    Draws all entropy in a single token_bytes call instead of one
+    secrets.choice (and its urandom read) per character. The modulo
+    bias over a 62-char alphabet is negligible for short codes, and
+    collisions are handled by retry in LinkShortenerService anyway.
+
     Args:
         length: Length of the short code (default 6 characters)
 
     Returns:
         str: Random alphanumeric string (a-zA-Z0-9)
     """
-    alphabet = string.ascii_letters + string.digits  # a-zA-Z0-9
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    return "".join(_ALPHABET[b % _ALPHABET_LEN] for b in secrets.token_bytes(length))
 
 
 def validate_url(url):
@@ -39,16 +58,35 @@ def validate_url(url):
     Raises:
         ValidationError: If URL is invalid, missing protocol, or is localhost
     """
-    # Check protocol
-    if not url.startswith(("http://", "https://")):
-        raise ValidationError("URL must include http:// or https://")
-
-    # Check for localhost
-    if "localhost" in url.lower() or "127.0.0.1" in url:
-        raise ValidationError("Localhost URLs are not allowed")
+    validate_url_constraints(url)
 
     # Validate URL format
-    validator = URLValidator()
-    validator(url)  # Raises ValidationError if invalid
+    _URL_VALIDATOR(url)  # Raises ValidationError if invalid
+
+    return True
+
+
+def validate_url_constraints(url):
+    """
+    Check only the protocol and localhost constraints, skipping the
+    format regex.
+
+    Used by form cleaning, where Django's URLField has already run the
+    full URLValidator and re-running it would be redundant work.
+
+    Args:
+        url: URL string to validate
+
+    Returns:
+        bool: True if constraints are satisfied
+
+    Raises:
+        ValidationError: If URL is missing its protocol or is localhost
+    """
+    # Check protocol and localhost in a single pre-compiled pass
+    if not _URL_RE.match(url):
+        if not url.lower().startswith(("http://", "https://")):
+            raise ValidationError("URL must include http:// or https://")
+        raise ValidationError("Localhost URLs are not allowed")
 
     return True
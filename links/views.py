@@ -6,21 +6,37 @@ Views:
     RedirectView: Handle short code redirect with click tracking
 """
 
+import hashlib
 import logging
-from django.shortcuts import render, redirect, get_object_or_404
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.http import Http404, HttpResponseRedirect
+from django.utils.functional import cached_property
+from django.shortcuts import render
 from django.views import View
 from django.views.generic import ListView, DeleteView, TemplateView
-from django.core.exceptions import ValidationError
+from django.conf import settings
 from django.contrib import messages
 from django.urls import reverse_lazy
-from django.db.models import Q, Count
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.db import connection, connections
+from django.db.models import Q, Count, Sum
 
-from .models import ShortLink, Click
+from .models import ShortLink, Click, TopLink
 from .services import LinkShortenerService, ClickTrackerService
-from .forms import LinkFilterForm
+from .forms import CreateShortLinkForm, LinkFilterForm
+from .cache import dashboard_version, get_redirect, set_redirect
 
 logger = logging.getLogger(__name__)
 
+# Whitelist of ORDER BY values the list view accepts, hoisted so the
+# per-request membership check is against a prebuilt frozenset
+_LIST_SORT_FIELDS = frozenset(["created_at", "-clicks_count", "clicks_count"])
+
 
 class CreateLinkView(View):
     """
@@ -52,15 +68,29 @@ class CreateLinkView(View):
         Returns:
             HttpResponse: Rendered template with created link or error
         """
-        original_url = request.POST.get("original_url", "").strip()
+        # The form validates and canonicalizes in one pass (lowercased
+        # scheme/host, utm_* params stripped), so the service can skip
+        # its own validation and dedup probes by canonical hash
+        form = CreateShortLinkForm(request.POST)
+        if not form.is_valid():
+            if not request.POST.get("original_url", "").strip():
+                messages.error(request, "Please enter a URL to shorten.")
+            else:
+                for error in form.errors.get("original_url", []):
+                    messages.error(request, error)
+            return render(
+                request,
+                "links/create.html",
+                {"original_url": request.POST.get("original_url", "")},
+            )
 
-        if not original_url:
-            messages.error(request, "Please enter a URL to shorten.")
-            return render(request, "links/create.html")
+        original_url = form.cleaned_data["original_url"]
 
         try:
             # Use service layer for business logic
-            short_link = LinkShortenerService.create_link(original_url)
+            short_link = LinkShortenerService.create_link(
+                original_url, skip_validation=True
+            )
 
             # Build short URL for display
             short_url = request.build_absolute_uri(f"/{short_link.short_code}")
@@ -72,10 +102,6 @@ class CreateLinkView(View):
             }
             return render(request, "links/create.html", context)
 
-        except ValidationError as e:
-            messages.error(request, str(e))
-            return render(request, "links/create.html", {"original_url": original_url})
-
         except Exception as e:
             logger.error(f"Error creating link: {e}", exc_info=True)
             messages.error(request, "An error occurred. Please try again.")
@@ -100,20 +126,106 @@ class RedirectView(View):
         Returns:
             HttpResponse: 302 redirect to original URL or 404 if not found
         """
-        # Lookup short link (raises 404 if not found)
-        short_link = get_object_or_404(ShortLink, short_code=short_code)
+        # Serve hot codes from the in-process cache; fall back to a
+        # model-less two-column read (index-only with the covering index)
+        # and warm the cache on miss
+        cached = get_redirect(short_code)
+        if cached is None:
+            try:
+                cached = ShortLink.objects.values_list(
+                    "pk", "original_url"
+                ).get(short_code=short_code)
+            except ShortLink.DoesNotExist:
+                raise Http404(f"No short link found for code: {short_code}")
+            set_redirect(short_code, *cached)
+        short_link_id, original_url = cached
 
         # Track click asynchronously (don't block redirect)
         try:
-            ClickTrackerService.record_click(short_link, request)
+            ClickTrackerService.record_click(short_link_id, short_code, request)
         except Exception as e:
             # Log but don't fail redirect if tracking fails
             logger.error(f"Click tracking failed for {short_code}: {e}")
 
-        # Redirect to original URL (FR-012a: <200ms target)
-        return redirect(short_link.original_url, permanent=False)
+        # Redirect to original URL (FR-012a: <200ms target).
+        # HttpResponseRedirect directly: original_url is a stored
+        # fully-qualified URL, so the shortcut's resolve_url pass
+        # (reverse() attempt + pattern matching) is dead weight here.
+        # With REDIRECT_PUBLIC_MAX_AGE set, CDNs and browsers may serve
+        # the 302 without touching Django at all - at the cost of
+        # untracked clicks for that TTL. The default keeps the response
+        # private/max-age=0 so every click reaches the tracker.
+        response = HttpResponseRedirect(original_url)
+        public_max_age = getattr(settings, "REDIRECT_PUBLIC_MAX_AGE", 0)
+        if public_max_age:
+            response["Cache-Control"] = f"public, max-age={public_max_age}"
+            response["Vary"] = "Accept-Encoding"
+        else:
+            response["Cache-Control"] = "private, max-age=0"
+        return response
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the COUNT query per filter signature.
+
+    With search filters the COUNT is as expensive as the page fetch
+    itself, and pagination runs it on every page view; a short TTL keeps
+    the number fresh enough for page navigation.
+    """
+
+    count_ttl = 60
+
+    @cached_property
+    def count(self):
+        """
+        Total object count, served from cache for count_ttl seconds.
+
+        Returns:
+            int: Number of objects across all pages
+        """
+        queryset = self.object_list
+        if not hasattr(queryset, "query"):
+            return len(queryset)
+        signature = hashlib.md5(str(queryset.query).encode()).hexdigest()
+        return cache.get_or_set(
+            f"linklist:cnt:{signature}", queryset.count, self.count_ttl
+        )
+
+
+# Mixed into every list ETag. The version counter lives in the cache
+# backend, which with the default LocMemCache is per-process and resets
+# on restart - without the nonce, a post-restart counter could collide
+# with a pre-restart value and 304 a client holding stale data. A fresh
+# nonce per process boot (and per worker) means an ETag never outlives
+# the counter it was derived from; the cost is one full response per
+# client after a restart or worker switch.
+_ETAG_BOOT_NONCE = uuid.uuid4().hex
+
+
+def _list_etag(request, *args, **kwargs):
+    """
+    ETag for the link list: data version plus the request's parameters.
+
+    dashboard_version() is bumped on every link save/delete and click
+    flush - the events that change what the list renders - so a
+    revisiting browser sends If-None-Match and gets a 304 for the cost
+    of one cache read, with no SELECT and no template render. The model
+    has no updated_at column to drive Last-Modified, and the version
+    counter is cheaper than a MAX() would be anyway.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        str: Opaque ETag value for this URL at the current data version
+    """
+    return hashlib.md5(
+        f"{_ETAG_BOOT_NONCE}:{dashboard_version()}:{request.GET.urlencode()}".encode()
+    ).hexdigest()
 
 
+@method_decorator(condition(etag_func=_list_etag), name="get")
 class LinkListView(ListView):
     """
     View for listing all short links with filtering and sorting.
@@ -125,6 +237,27 @@ class LinkListView(ListView):
     template_name = "links/list.html"
     context_object_name = "links"
     paginate_by = 20
+    paginator_class = CachedCountPaginator
+
+    @staticmethod
+    def _parse_after(raw):
+        """
+        Parse an `after` keyset cursor of the form `<iso_datetime>:<id>`.
+
+        Args:
+            raw: Raw query parameter value (may be None or malformed)
+
+        Returns:
+            tuple: (datetime, int) cursor position, or None if invalid
+        """
+        if not raw:
+            return None
+        try:
+            # rsplit: the ISO timestamp itself contains colons
+            timestamp, _, link_id = raw.rpartition(":")
+            return datetime.fromisoformat(timestamp), int(link_id)
+        except (TypeError, ValueError):
+            return None
 
     def get_queryset(self):
         """
@@ -133,7 +266,10 @@ class LinkListView(ListView):
         Returns:
             QuerySet: Filtered ShortLink queryset
         """
-        queryset = ShortLink.objects.all()
+        # only() keeps the page fetch to the columns the template shows
+        queryset = ShortLink.objects.only(
+            "id", "short_code", "original_url", "clicks_count", "created_at"
+        )
 
         # Get filter parameters
         search = self.request.GET.get("search", "").strip()
@@ -153,8 +289,22 @@ class LinkListView(ListView):
         if date_to:
             queryset = queryset.filter(created_at__lte=date_to)
 
-        # Apply sorting
-        if sort in ["-created_at", "created_at", "-clicks_count", "clicks_count"]:
+        # Apply sorting. The default newest-first sort paginates by
+        # keyset: an `after` cursor turns every page into an index seek
+        # on (created_at, id) instead of an OFFSET scan that walks all
+        # the rows it skips. Other sort orders stay on the paginator.
+        if sort == "-created_at":
+            cursor = self._parse_after(self.request.GET.get("after"))
+            if cursor is not None:
+                after_ts, after_id = cursor
+                queryset = queryset.filter(
+                    Q(created_at__lt=after_ts)
+                    | Q(created_at=after_ts, id__lt=after_id)
+                )
+            # id tiebreak makes the ordering total, so the cursor never
+            # skips or repeats rows sharing a timestamp
+            queryset = queryset.order_by("-created_at", "-id")
+        elif sort in _LIST_SORT_FIELDS:
             queryset = queryset.order_by(sort)
 
         return queryset
@@ -168,6 +318,20 @@ class LinkListView(ListView):
         """
         context = super().get_context_data(**kwargs)
         context["filter_form"] = LinkFilterForm(self.request.GET or None)
+
+        # Next-page cursor for the keyset path: the last row's
+        # (created_at, id), with the active filters carried along
+        page_obj = context.get("page_obj")
+        sort = self.request.GET.get("sort", "-created_at")
+        if page_obj is not None and page_obj.has_next() and sort == "-created_at":
+            # Page.__getitem__ materializes the page, so the slice the
+            # template will render is fetched exactly once
+            last = page_obj[-1]
+            params = self.request.GET.copy()
+            params.pop("page", None)
+            params["after"] = f"{last.created_at.isoformat()}:{last.pk}"
+            context["next_after_qs"] = params.urlencode()
+
         return context
 
 
@@ -203,10 +367,20 @@ class DashboardView(TemplateView):
 
     template_name = "links/dashboard.html"
 
+    # Cached stats live at most this long even without invalidation
+    cache_ttl = 120
+
+    # Ceiling for the recent_limit query param
+    max_recent_limit = 1000
+
     def get_context_data(self, **kwargs):
         """
         Calculate and return dashboard statistics.
 
+        Stats are cached per filter combination with a short TTL; the key
+        embeds a version that click flushes and link writes bump, so
+        cached entries die on invalidation or TTL, whichever comes first.
+
         Returns:
             dict: Context with aggregate stats
         """
@@ -219,6 +393,58 @@ class DashboardView(TemplateView):
         param_value = self.request.GET.get("param_value", "").strip()
         min_clicks = self.request.GET.get("min_clicks")
 
+        # Widened recent-clicks window, bounded so a crafted URL can't
+        # ask for the whole Click table
+        recent_limit = 50
+        raw_limit = self.request.GET.get("recent_limit", "")
+        if raw_limit.isdecimal():
+            recent_limit = min(int(raw_limit), self.max_recent_limit)
+
+        filter_signature = hashlib.md5(
+            repr(
+                (date_from, date_to, param_key, param_value, min_clicks, recent_limit)
+            ).encode()
+        ).hexdigest()
+        version = dashboard_version()
+        cache_key = f"dash:{version}:{filter_signature}"
+
+        stats = cache.get_or_set(
+            cache_key,
+            lambda: self._load_stats(
+                date_from, date_to, param_key, param_value, min_clicks, recent_limit
+            ),
+            self.cache_ttl,
+        )
+
+        context.update(stats)
+        context.update({
+            "date_from": date_from or "",
+            "date_to": date_to or "",
+            "param_key": param_key,
+            "param_value": param_value,
+            "min_clicks": min_clicks or "",
+            "recent_limit": recent_limit,
+            # Keys the template fragment cache alongside the filters,
+            # so click flushes and link writes invalidate rendered HTML
+            # the same way they invalidate the stats
+            "dash_ver": version,
+        })
+
+        return context
+
+    @staticmethod
+    def _load_stats(
+        date_from, date_to, param_key, param_value, min_clicks, recent_limit=50
+    ):
+        """
+        Run the dashboard queries for one filter combination.
+
+        Querysets are materialized to lists so the cached entry is
+        concrete rather than a lazy queryset.
+
+        Returns:
+            dict: Aggregate stats, top links, and recent clicks
+        """
         # Base querysets
         links_qs = ShortLink.objects.all()
         clicks_qs = Click.objects.all()
@@ -229,42 +455,110 @@ class DashboardView(TemplateView):
         if date_to:
             clicks_qs = clicks_qs.filter(clicked_at__lte=date_to)
 
-        # Apply param filter (search in JSON field)
+        # Apply param filter: on PostgreSQL the native JSONB containment
+        # lookup is exact and served by the GIN index; other vendors
+        # don't support __contains on JSONField, so fall back to the
+        # substring match over the serialized JSON
         if param_key and param_value:
-            clicks_qs = clicks_qs.filter(
-                query_params__icontains=f'"{param_key}"'
-            ).filter(
-                query_params__icontains=f'"{param_value}"'
+            if connection.vendor == "postgresql":
+                clicks_qs = clicks_qs.filter(
+                    query_params__contains={param_key: param_value}
+                )
+            else:
+                clicks_qs = clicks_qs.filter(
+                    query_params__icontains=f'"{param_key}"'
+                ).filter(
+                    query_params__icontains=f'"{param_value}"'
+                )
+
+        # Apply min_clicks filter. isdecimal() rather than try/int():
+        # crawlers routinely hit dashboards with garbage params, and the
+        # guard skips building and unwinding a ValueError per bad hit.
+        # (isdecimal, not isdigit - the latter accepts superscripts and
+        # other Unicode digits that int() rejects)
+        min_clicks_applied = False
+        if min_clicks and min_clicks.isdecimal():
+            links_qs = links_qs.filter(clicks_count__gte=int(min_clicks))
+            min_clicks_applied = True
+
+        def load_totals():
+            # Totals: with no click-level filter, both numbers come from
+            # ShortLink - a row count plus a Sum over the denormalized
+            # counter - sidestepping a COUNT(*) scan of the much larger
+            # Click table; one fused aggregate when min_clicks is off
+            has_click_filters = bool(
+                date_from or date_to or (param_key and param_value)
             )
-
-        # Apply min_clicks filter
-        if min_clicks:
+            if not has_click_filters and not min_clicks_applied:
+                totals = links_qs.aggregate(
+                    total_links=Count("id"), total_clicks=Sum("clicks_count")
+                )
+                return totals["total_links"], totals["total_clicks"] or 0
+            if not has_click_filters:
+                return links_qs.count(), (
+                    ShortLink.objects.aggregate(total=Sum("clicks_count"))["total"]
+                    or 0
+                )
+            return links_qs.count(), clicks_qs.count()
+
+        def load_top_links():
+            # Top links: the unfiltered panel reads the links_top10
+            # materialized view on PostgreSQL - ten presorted rows
+            # instead of an ORDER BY over the whole table (refreshed by
+            # the refresh_top_links command, so a few minutes stale at
+            # most). Filtered dashboards and other vendors keep the
+            # live sort. Panels come back as values() dicts: the
+            # template only reads a few fields, so model __init__ and
+            # descriptor overhead per row buys nothing, and the cached
+            # entry stays plain data
+            top_fields = ("short_code", "original_url", "clicks_count", "created_at")
+            if not min_clicks_applied and connection.vendor == "postgresql":
+                return list(TopLink.objects.values(*top_fields)[:10])
+            return list(links_qs.order_by("-clicks_count").values(*top_fields)[:10])
+
+        def load_recent_clicks():
+            # short_link__short_code pulls the code through the FK JOIN
+            # in the same query, without materializing Click instances
+            recent_qs = clicks_qs.values(
+                "clicked_at",
+                "ip_address",
+                "referrer",
+                "query_params",
+                "short_link__short_code",
+            ).order_by("-clicked_at")[:recent_limit]
+            # Widened windows stream through a server-side cursor in
+            # chunks (where the backend supports it) instead of
+            # buffering the whole result set twice - once in the
+            # driver, once in the queryset result cache
+            if recent_limit > 200:
+                return list(recent_qs.iterator(chunk_size=500))
+            return list(recent_qs)
+
+        def run_closing(loader):
+            # Each pool thread opens its own thread-local connection;
+            # close it on the way out so short-lived threads don't leak
+            # connections the pool won't reuse soon
             try:
-                min_clicks_int = int(min_clicks)
-                links_qs = links_qs.filter(clicks_count__gte=min_clicks_int)
-            except ValueError:
-                pass
-
-        # Calculate aggregate stats
-        total_links = links_qs.count()
-        total_clicks = clicks_qs.count()
-
-        # Get top links by clicks
-        top_links = links_qs.order_by("-clicks_count")[:10]
-
-        # Get recent clicks with metadata
-        recent_clicks = clicks_qs.select_related("short_link").order_by("-clicked_at")[:50]
-
-        context.update({
+                return loader()
+            finally:
+                for conn in connections.all(initialized_only=True):
+                    conn.close()
+
+        # The three loads are independent, so on a cache miss they run
+        # concurrently and the dashboard pays max-of-latencies instead
+        # of sum - the win scales with per-query RTT to a remote DB.
+        # (An async view was considered, but under the WSGI deployment
+        # sync_to_async hops cost more than plain worker threads.)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            totals_future = pool.submit(run_closing, load_totals)
+            top_links_future = pool.submit(run_closing, load_top_links)
+            recent_clicks_future = pool.submit(run_closing, load_recent_clicks)
+
+        total_links, total_clicks = totals_future.result()
+
+        return {
             "total_links": total_links,
             "total_clicks": total_clicks,
-            "top_links": top_links,
-            "recent_clicks": recent_clicks,
-            "date_from": date_from or "",
-            "date_to": date_to or "",
-            "param_key": param_key,
-            "param_value": param_value,
-            "min_clicks": min_clicks or "",
-        })
-
-        return context
+            "top_links": top_links_future.result(),
+            "recent_clicks": recent_clicks_future.result(),
+        }
@@ -0,0 +1,98 @@
+"""
+Tests for the analytics dashboard view.
+
+Locks in the dashboard's caching behavior: a cold request computes
+correct stats through the values()/aggregate query paths, and a warm
+request is served entirely from cache without touching the database.
+
+TransactionTestCase (not TestCase) because the dashboard's cache-miss
+loader runs its queries on worker threads, whose connections cannot see
+rows still uncommitted inside a test transaction.
+"""
+
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from links.models import Click, ShortLink
+
+
+class DashboardViewTests(TransactionTestCase):
+    """
+    Tests for DashboardView stats, filters, and query counts.
+    """
+
+    def setUp(self):
+        """Create two links with clicks and reset all caches."""
+        cache.clear()
+        self.link_hot = ShortLink.objects.create(
+            original_url="https://example.com/hot", short_code="hot001"
+        )
+        self.link_cold = ShortLink.objects.create(
+            original_url="https://example.com/cold", short_code="cold01"
+        )
+        Click.objects.bulk_create(
+            [
+                Click(
+                    short_link=self.link_hot,
+                    short_code_snapshot="hot001",
+                    clicked_at=timezone.now(),
+                    query_params={"utm_source": "newsletter"},
+                )
+                for _ in range(3)
+            ]
+            + [
+                Click(
+                    short_link=self.link_cold,
+                    short_code_snapshot="cold01",
+                    clicked_at=timezone.now(),
+                )
+            ]
+        )
+        ShortLink.objects.filter(pk=self.link_hot.pk).update(clicks_count=3)
+        ShortLink.objects.filter(pk=self.link_cold.pk).update(clicks_count=1)
+        self.url = reverse("links:dashboard")
+
+    def test_cold_dashboard_renders_aggregate_stats(self):
+        """A cache-miss request computes totals and both panels."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["total_links"], 2)
+        self.assertEqual(response.context["total_clicks"], 4)
+        top_codes = [row["short_code"] for row in response.context["top_links"]]
+        self.assertEqual(top_codes, ["hot001", "cold01"])
+        self.assertEqual(len(response.context["recent_clicks"]), 4)
+        self.assertContains(response, "hot001")
+
+    def test_warm_dashboard_issues_no_queries(self):
+        """An identical repeat request is served without any DB queries."""
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_min_clicks_filter_scopes_link_total_only(self):
+        """min_clicks narrows total_links but not the overall click sum."""
+        response = self.client.get(self.url, {"min_clicks": "2"})
+        self.assertEqual(response.context["total_links"], 1)
+        self.assertEqual(response.context["total_clicks"], 4)
+
+    def test_garbage_numeric_params_are_ignored(self):
+        """Unicode-digit and junk values fall back to the defaults."""
+        for params in (
+            {"min_clicks": "²"},
+            {"min_clicks": "abc"},
+            {"recent_limit": "¹"},
+        ):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context["total_links"], 2)
+
+    def test_filtered_requests_get_distinct_cache_entries(self):
+        """Different filter combinations never share cached stats."""
+        self.client.get(self.url)
+        response = self.client.get(self.url, {"min_clicks": "2"})
+        self.assertEqual(response.context["total_links"], 1)
+        response = self.client.get(self.url)
+        self.assertEqual(response.context["total_links"], 2)